@@ -26,10 +26,10 @@ if __name__ == "__main__":
         license='GNU General Public License (GPL) v3',
         packages=['smact','smact.tests'],
         package_data={'smact': ['data/*.txt','data/*.csv','data/*.data',
-                       'data/*.xlsx','data/*.json']},
+                       'data/*.xlsx','data/*.json','data/*.pkl']},
         zip_safe=False,
         test_suite='smact.tests.test',
-        install_requires=['scipy','numpy','spglib', 'pymatgen', 'ase'],
+        install_requires=['scipy','numpy','pandas','spglib', 'pymatgen', 'ase'],
         classifiers=['Programming Language :: Python',
                      'Development Status :: 5 - Production/Stable',
                      'Intended Audience :: Science/Research',
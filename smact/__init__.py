@@ -97,18 +97,19 @@ class Element(object):
 
         """
 
-        dataset = data_loader.lookup_element_data(symbol, copy=False)
+        dataset = data_loader.lookup_element_data(symbol)
 
         if dataset == None:
             raise NameError("Elemental data for {0} not found.".format(symbol))
 
         # Set coordination-environment data from the Shannon-radius data.
-        # As above, it is safe to use copy = False with this Get* function.
+        # The lookup functions return shared immutable datasets, so no
+        # copying is involved.
 
-        shannon_data = data_loader.lookup_element_shannon_radius_data(symbol, copy=False)
+        shannon_data = data_loader.lookup_element_shannon_radius_data(symbol)
 
         if shannon_data != None:
-            coord_envs = [row['coordination'] for row in shannon_data]
+            coord_envs = [row.coordination for row in shannon_data]
         else:
             coord_envs = None
 
@@ -128,33 +129,36 @@ class Element(object):
         else:
             sse_Pauling = None
 
-        for attribute, value in (
-            ('coord_envs', coord_envs),
-            ('covalent_radius', dataset['r_cov']),
-            ('crustal_abundance', dataset['Abundance']),
-            ('e_affinity', dataset['e_affinity']),
-            ('eig', dataset['p_eig']),
-            ('eig_s', dataset['s_eig']),
-            ('HHI_p', HHI_scores[0]),
-            ('HHI_r', HHI_scores[1]),
-            ('ionpot', dataset['ion_pot']),
-            ('mass', dataset['Mass']),
-            ('name', dataset['Name']),
-            ('number', dataset['Z']),
-            ('oxidation_states',
-             data_loader.lookup_element_oxidation_states(symbol)),
-            ('oxidation_states_icsd',
-             data_loader.lookup_element_oxidation_states_icsd(symbol)),
-            ('oxidation_states_sp',
-             data_loader.lookup_element_oxidation_states_sp(symbol)),
-            ('dipol', dataset['dipol']),
-            ('pauling_eneg', dataset['el_neg']),
-            ('SSE', sse),
-            ('SSEPauling', sse_Pauling),
-            ('symbol', symbol),
-            #('vdw_radius', dataset['RVdW']),
-            ):
-            setattr(self, attribute, value)
+        # Assign the attributes directly rather than looping over an
+        # (attribute, value) table with setattr(): the constructor runs
+        # once per Element in screening loops, and the plain
+        # assignments avoid building the intermediate tuples and
+        # dispatching setattr per attribute.
+
+        self.coord_envs = coord_envs
+        self.covalent_radius = dataset.r_cov
+        self.crustal_abundance = dataset.Abundance
+        self.e_affinity = dataset.e_affinity
+        self.eig = dataset.p_eig
+        self.eig_s = dataset.s_eig
+        self.HHI_p = HHI_scores[0]
+        self.HHI_r = HHI_scores[1]
+        self.ionpot = dataset.ion_pot
+        self.mass = dataset.Mass
+        self.name = dataset.Name
+        self.number = dataset.Z
+        self.oxidation_states = \
+            data_loader.lookup_element_oxidation_states(symbol)
+        self.oxidation_states_icsd = \
+            data_loader.lookup_element_oxidation_states_icsd(symbol)
+        self.oxidation_states_sp = \
+            data_loader.lookup_element_oxidation_states_sp(symbol)
+        self.dipol = dataset.dipol
+        self.pauling_eneg = dataset.el_neg
+        self.SSE = sse
+        self.SSEPauling = sse_Pauling
+        self.symbol = symbol
+        #self.vdw_radius = dataset.RVdW
 
 class Species(Element):
     """
@@ -199,24 +203,17 @@ class Species(Element):
         self.oxidation = oxidation
         self.coordination = coordination
 
-        # Get shannon radius for the oxidation state and coordination.
+        # Get shannon radius and ionic radius for the oxidation state
+        # and coordination.
 
         self.shannon_radius = None;
-
-        shannon_data = data_loader.lookup_element_shannon_radius_data(symbol);
-
-        if shannon_data:
-            for dataset in shannon_data:
-                if dataset['charge'] == oxidation and dataset['coordination'] == coordination:
-                    self.shannon_radius = dataset['crystal_radius'];
-
-        # Get ionic radius
         self.ionic_radius = None;
 
-        if shannon_data:
-            for dataset in shannon_data:
-                if dataset['charge'] == oxidation and dataset['coordination'] == coordination:
-                    self.ionic_radius = dataset['ionic_radius'];
+        shannon_data = data_loader.lookup_shannon_radius(symbol, oxidation, coordination)
+
+        if shannon_data is not None:
+            self.shannon_radius = shannon_data.crystal_radius;
+            self.ionic_radius = shannon_data.ionic_radius;
 
         # Get SSE_2015 (revised) for the oxidation state.
 
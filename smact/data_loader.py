@@ -23,19 +23,56 @@ naively constructing several of these objects.  It also implements a
 switchable system to print verbose warning messages about possible
 missing data (mainly for debugging purposes). In general these fuctions
 are used in the background and it is not necessary to use them directly.
+
+The module stays pure Python by design: the tables are parsed in bulk
+by the pandas/numpy C parsers (or restored from a pre-built pickle),
+and repeat lookups are served from C-implemented lru_cache hashtables,
+so there is no compiled extension to build or distribute.
 """
 
-from builtins import next
-from builtins import map
-from builtins import zip
-import csv
 import os
+import pickle
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
 
 from smact import data_directory
 
-# Module-level switch: print "verbose" warning messages
-# about missing data.
-_print_warnings = False
+# "Verbose" warning messages about missing data are routed through the
+# module-level _warn, which set_warnings() rebinds to either a printing
+# or a no-op implementation.  Binding the choice once keeps the
+# (default-off) warning system out of the lookup hot path: no global
+# flag is read or tested per call.
+
+
+# Warning messages already emitted.  Repeated queries for the same
+# missing symbol (common when screening compositions in a loop) are
+# reported once rather than flooding the output.
+
+_warned_messages = set()
+
+
+def _warn_verbose(message, *args):
+    """Print a warning message about missing data (once per message)."""
+
+    message = "WARNING: " + message.format(*args)
+
+    if message not in _warned_messages:
+        _warned_messages.add(message)
+        print(message)
+
+
+def _warn_quiet(message, *args):
+    """Discard a warning message about missing data."""
+
+    pass
+
+_warn = _warn_quiet
 
 
 def set_warnings(enable=True):
@@ -49,30 +86,124 @@ def set_warnings(enable=True):
     enable (bool) : print verbose warning messages.
     """
 
-    global _print_warnings
-    _print_warnings = enable
+    global _warn
+    _warn = _warn_verbose if enable else _warn_quiet
+
+    # Re-enabling warnings starts the once-per-message suppression
+    # afresh.  This works even for symbols whose misses are already
+    # memoized, because the warnings are emitted by the uncached public
+    # wrappers rather than the lru_cache-backed lookup cores.
+
+    if enable:
+        _warned_messages.clear()
 
 
 def _get_data_rows(filename):
     """Generator for datafile entries by row"""
-    with open(filename, 'r') as file:
+    # The files read here are plain ASCII with Unix line endings, so
+    # the universal-newline translation and multi-byte decoding
+    # machinery can both be switched off.
+    with open(filename, 'r', encoding='ascii', newline='') as file:
         for line in file:
-            line = line.strip()
-            if line[0] != '#':
-                yield line.split()
-
-def float_or_None(x):
-    """Cast a string to a float or to a None."""
-    try:
-        return float(x)
-    except ValueError:
-        return None
+            # str.split() discards leading/trailing whitespace itself,
+            # so the line never needs to be strip()-ed first; blank
+            # lines are skipped rather than raising an IndexError.
+            if line.startswith('#') or line.isspace():
+                continue
+            yield line.split()
+
+# Pre-parsed copy of all the data tables, built by
+# tools/build_data_cache.py and shipped alongside the text files.
+# Loading it replaces the text tokenisation and per-field numeric
+# conversion below with a single pickle.load(); if the file is absent
+# (e.g. when running from a source checkout with modified data files),
+# each loader falls back to parsing its text file as before.
+
+_data_cache = None
+
+_DATA_CACHE_FILENAME = "smact_data.pkl"
 
-# Loader and cache for the element oxidation-state data.
-_el_ox_states = None
 
+def _load_data_cache():
+    """Load (once) the pre-parsed data tables from the bundled pickle.
 
-def lookup_element_oxidation_states(symbol, copy=True):
+    Returns:
+        dict: Mapping of table names to pre-parsed (plain) data
+            structures, or an empty dict if no cache file is bundled.
+    """
+
+    global _data_cache
+
+    if _data_cache is None:
+        cache_file = os.path.join(data_directory, _DATA_CACHE_FILENAME)
+
+        if os.path.isfile(cache_file):
+            with open(cache_file, 'rb') as file:
+                _data_cache = pickle.load(file)
+
+            # Intern the symbol keys so later dict probes compare
+            # interned strings by identity rather than character by
+            # character.
+
+            _data_cache = {name: {sys.intern(sym): data
+                                  for sym, data in table.items()}
+                           for name, table in _data_cache.items()}
+        else:
+            _data_cache = {}
+
+    return _data_cache
+
+# Loaders and caches for the element oxidation-state data.  The three
+# public lookup functions below differ only in which data file (and
+# which slot of the pre-parsed pickle) backs them, so they share a
+# single data-driven implementation.
+
+_OX_STATE_SOURCES = {
+    'smact': ("oxidation_states.txt", 'el_ox_states'),
+    'icsd': ("oxidation_states_icsd.txt", 'el_ox_states_icsd'),
+    'sp': ("oxidation_states_SP.txt", 'el_ox_states_sp'),
+    }
+
+_ox_state_tables = {}
+
+
+@lru_cache(maxsize=None)
+def _lookup_oxidation_states(source, symbol):
+    """Shared implementation of the oxidation-state lookups.
+
+    Results are memoized with lru_cache, so repeat lookups for the same
+    symbol are a single C-level hash probe; this is safe because the
+    returned tuples are immutable.  Missing-data warnings are emitted
+    by the (uncached) public wrappers, so toggling set_warnings() works
+    even for symbols whose misses are already memoized here.
+
+    Args:
+        source (str) : key into _OX_STATE_SOURCES selecting the dataset.
+        symbol (str) : the atomic symbol of the element to look up.
+    """
+
+    table = _ox_state_tables.get(source)
+
+    if table is None:
+        filename, cache_key = _OX_STATE_SOURCES[source]
+
+        table = _load_data_cache().get(cache_key)
+
+        if table is None:
+            table = {}
+
+            for items in _get_data_rows(os.path.join(data_directory,
+                                                     filename)):
+                table[sys.intern(items[0])] = \
+                    tuple(int(oxidationState)
+                          for oxidationState in items[1:])
+
+        _ox_state_tables[source] = table
+
+    return table.get(symbol)
+
+
+def lookup_element_oxidation_states(symbol, mutable=False):
     """
     Retrieve a list of known oxidation states for an element.
     The oxidation states list used is the SMACT default and
@@ -80,47 +211,28 @@ def lookup_element_oxidation_states(symbol, copy=True):
 
     Args:
         symbol (str) : the atomic symbol of the element to look up.
-        copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+        mutable (Optional(bool)): if True, return a fresh mutable list
+            rather than the shared immutable tuple from the cache --
+            only needed if the caller wants to modify the result.
 
     Returns:
-        list: List of known oxidation states for the element.
+        tuple: Known oxidation states for the element (a list if
+            mutable=True).
 
             Returns None if oxidation states for the Element were not
             found in the external data.
     """
 
-    global _el_ox_states
-
-    if _el_ox_states is None:
-        _el_ox_states = {}
-
-        for items in _get_data_rows(os.path.join(data_directory,
-                                                 "oxidation_states.txt")):
-            _el_ox_states[items[0]] = [int(oxidationState)
-                                       for oxidationState in items[1:]]
+    oxidation_states = _lookup_oxidation_states('smact', symbol)
 
-    if symbol in _el_ox_states:
-        if copy:
-            # _el_ox_states stores lists -> if copy is set, make an implicit
-            # deep copy.  The elements of the lists are integers, which are
-            # "value types" in Python.
-
-            return [oxidationState for oxidationState in _el_ox_states[symbol]]
-        else:
-            return _el_ox_states[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Oxidation states for element {0} "
-                  "not found.".format(symbol))
+    if oxidation_states is None:
+        _warn("Oxidation states for element {0} not found.", symbol)
         return None
 
-_el_ox_states_icsd = None
+    return list(oxidation_states) if mutable else oxidation_states
 
 
-def lookup_element_oxidation_states_icsd(symbol, copy=True):
+def lookup_element_oxidation_states_icsd(symbol, mutable=False):
     """
     Retrieve a list of known oxidation states for an element.
     The oxidation states list used contains only those found
@@ -128,31 +240,28 @@ def lookup_element_oxidation_states_icsd(symbol, copy=True):
 
     Args:
         symbol (str) : the atomic symbol of the element to look up.
-        copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+        mutable (Optional(bool)): if True, return a fresh mutable list
+            rather than the shared immutable tuple from the cache --
+            only needed if the caller wants to modify the result.
 
     Returns:
-        list: List of known oxidation states for the element.
+        tuple: Known oxidation states for the element (a list if
+            mutable=True).
 
             Return None if oxidation states for the Element were not
             found in the external data.
     """
 
-    global _el_ox_states_icsd
+    oxidation_states = _lookup_oxidation_states('icsd', symbol)
 
-    if _el_ox_states_icsd is None:
-        _el_ox_states_icsd = {}
+    if oxidation_states is None:
+        _warn("Oxidation states for element {0} not found.", symbol)
+        return None
 
-        for items in _get_data_rows(os.path.join(data_directory,
-                                                 "oxidation_states_icsd.txt")):
-            _el_ox_states_icsd[items[0]] = [int(oxidationState)
-                                       for oxidationState in items[1:]]
+    return list(oxidation_states) if mutable else oxidation_states
 
-_el_ox_states_sp = None
 
-def lookup_element_oxidation_states_sp(symbol, copy=True):
+def lookup_element_oxidation_states_sp(symbol, mutable=False):
     """
     Retrieve a list of known oxidation states for an element.
     The oxidation states list used contains only those that
@@ -160,44 +269,26 @@ def lookup_element_oxidation_states_sp(symbol, copy=True):
 
     Args:
         symbol (str) : the atomic symbol of the element to look up.
-        copy (Optional(bool)): if True (default), return a copy of the
-            oxidation-state list, rather than a reference to the cached
-            data -- only use copy=False in performance-sensitive code
-            and where the list will not be modified!
+        mutable (Optional(bool)): if True, return a fresh mutable list
+            rather than the shared immutable tuple from the cache --
+            only needed if the caller wants to modify the result.
 
     Returns:
-        list: List of known oxidation states for the element.
+        tuple: Known oxidation states for the element (a list if
+            mutable=True).
 
             Return None if oxidation states for the Element were not
             found in the external data.
     """
 
-    global _el_ox_states_sp
-
-    if _el_ox_states_sp is None:
-        _el_ox_states_sp = {}
-
-        for items in _get_data_rows(os.path.join(data_directory,
-                                                 "oxidation_states_SP.txt")):
-            _el_ox_states_sp[items[0]] = [int(oxidationState)
-                                       for oxidationState in items[1:]]
-
-
-    if symbol in _el_ox_states_sp:
-        if copy:
-            # _el_ox_states_sp stores lists -> if copy is set, make an implicit
-            # deep copy.  The elements of the lists are integers, which are
-            # "value types" in Python.
+    oxidation_states = _lookup_oxidation_states('sp', symbol)
 
-            return [oxidationState for oxidationState in _el_ox_states_sp[symbol]]
-        else:
-            return _el_ox_states_sp[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Oxidation states for element {0} "
-                  "not found.".format(symbol))
+    if oxidation_states is None:
+        _warn("Oxidation states for element {0} not found.", symbol)
         return None
 
+    return list(oxidation_states) if mutable else oxidation_states
+
 # Loader and cache for the element HHI scores.
 
 _element_hhis = None
@@ -216,98 +307,131 @@ def lookup_element_hhis(symbol):
             Return None if values for the elements were
             not found in the external data.
     """
+    hhis = _lookup_element_hhis(symbol)
 
-    global _element_hhis
+    if hhis is None:
+        _warn("HHI data for element {0} not found.", symbol)
 
-    if _element_hhis is None:
-        _element_hhis = {}
+    return hhis
 
-        with open(os.path.join(data_directory, "HHIs.txt"),
-                  'r') as file:
-            for line in file:
-                line = line.strip()
 
-                if line[0] != '#':
-                    items = line.split()
+@lru_cache(maxsize=None)
+def _lookup_element_hhis(symbol):
+    """Memoized core of lookup_element_hhis()."""
 
-                    _element_hhis[items[0]] = (float(items[1]),
-                                               float(items[2]))
+    global _element_hhis
 
-    if symbol in _element_hhis:
-        return _element_hhis[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: HHI data for element "
-                  "{0} not found.".format(symbol))
+    if _element_hhis is None:
+        _element_hhis = _load_data_cache().get('element_hhis')
 
-        return None
+    if _element_hhis is None:
+        # The file has three fixed columns, so all rows can be parsed
+        # by a single numpy C routine rather than per-field float()
+        # calls.
+        table = np.loadtxt(os.path.join(data_directory, "HHIs.txt"),
+                           comments='#',
+                           dtype=[('symbol', 'U3'), ('hhi_p', 'f8'),
+                                  ('hhi_r', 'f8')])
+
+        _element_hhis = {sys.intern(sym.item()): (hhi_p.item(),
+                                                  hhi_r.item())
+                         for sym, hhi_p, hhi_r in table}
+
+    return _element_hhis.get(symbol)
 
 # Loader and cache for elemental data
 
 _element_data = None
 
-def lookup_element_data(symbol, copy=True):
+# Lightweight immutable record for an element_data.txt row.  Compared
+# to a dict per element this is smaller, faster to read a field from,
+# and safe to hand out without copying.
+
+ElementData = namedtuple('ElementData',
+                         ('Symbol', 'Name', 'Z', 'Mass', 'r_cov',
+                          'e_affinity', 'p_eig', 's_eig', 'Abundance',
+                          'el_neg', 'ion_pot', 'dipol'))
+
+
+def lookup_element_data(symbol, mutable=False):
     """
     Retrieve tabulated data for an element.
 
     The table "data/element_data.txt" contains a collection of relevant
     atomic data. If a cache exists in the form of the module-level
-    variable _element_data, this is returned. Otherwise, a dictionary is
-    constructed from the data table and cached before returning it.
+    variable _element_data, this is returned. Otherwise, the table is
+    parsed and cached before returning it.
 
     Args:
         symbol (str) : Atomic symbol for lookup
 
-        copy (Optional(bool)) : if True (default), return a copy of the
-            data dictionary, rather than a reference to the cached
-            object -- only used copy=False in performance-sensitive code
-            and where you are certain the dictionary will not be
-            modified!
+        mutable (Optional(bool)) : if True, return a fresh mutable dict
+            rather than the shared immutable record from the cache --
+            only needed if the caller wants to modify the result.
 
-    Returns (dict) : Dictionary of data for given element, keyed by
-        column headings from data/element_data.txt.
+    Returns (ElementData) : Immutable record of data for the given
+        element, with fields named after the column headings from
+        data/element_data.txt (a dict if mutable=True).
     """
+    dataset = _lookup_element_data(symbol)
+
+    if dataset is None:
+        _warn("Elemental data for {0} not found.", symbol)
+        return None
+
+    return dict(dataset._asdict()) if mutable else dataset
+
+
+@lru_cache(maxsize=None)
+def _lookup_element_data(symbol):
+    """Memoized core of lookup_element_data()."""
+
     global _element_data
+    if _element_data is None:
+        cached = _load_data_cache().get('element_data')
+
+        if cached is not None:
+            _element_data = {symbol: ElementData(**dataset)
+                             for symbol, dataset in cached.items()}
+
     if _element_data is None:
         _element_data = {}
-        keys = ('Symbol', 'Name', 'Z', 'Mass', 'r_cov', 'e_affinity',
-                'p_eig', 's_eig', 'Abundance', 'el_neg', 'ion_pot',
-                'dipol')
-        for items in _get_data_rows(os.path.join(data_directory,
-                                                 "element_data.txt")):
-            # First two columns are strings and should be left intact
-            # Everything else is numerical and should be cast to a float
-            # or, if not clearly a number, to None
-            clean_items = items[0:2] + list(map(float_or_None, items[2:]))
-
-            _element_data.update({items[0]:
-                                  dict(list(zip(keys, clean_items)))})
-
-    if symbol in _element_data:
-        if copy:
-            # _element_open_babel_derived_data stores dictionaries
-            # -> if copy is set, use the dict.copy() function to return
-            # a copy. The values are all Python "value types", so
-            # explicitly cloning the elements is not necessary to make
-            # a deep copy.
-
-            return _element_data[symbol].copy()
-        else:
-            return _element_data[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Elemental data for {0}"
-                  " not found.".format(symbol))
-            print(_element_data)
-        return None
+
+        # First two columns are strings and should be left intact.
+        # Everything else is numerical and is converted in bulk by the
+        # pandas C parser; entries which are not clearly a number come
+        # back as NaN and are mapped to None below.
+        df = pd.read_csv(os.path.join(data_directory, "element_data.txt"),
+                         sep=r'\s+', comment='#', header=None,
+                         names=ElementData._fields)
+
+        for items in df.itertuples(index=False):
+            clean_items = list(items[0:2]) + [None if pd.isnull(value)
+                                              else float(value)
+                                              for value in items[2:]]
+
+            _element_data[sys.intern(items[0])] = \
+                ElementData._make(clean_items)
+
+    # _element_data stores immutable records, so the cached entry is
+    # handed out directly.  The values are all Python "value types", so
+    # nothing further is needed to make a deep copy.
+
+    return _element_data.get(symbol)
 
 
 # Loader and cache for the element Shannon radii datasets.
 
 _element_shannon_radii_data = None
 
+# Lightweight immutable record for a shannon_radii.csv row.
+
+ShannonData = namedtuple('ShannonData',
+                         ('charge', 'coordination', 'crystal_radius',
+                          'ionic_radius', 'comment'))
 
-def lookup_element_shannon_radius_data(symbol, copy=True):
+
+def lookup_element_shannon_radius_data(symbol, mutable=False):
     """
     Retrieve Shannon radii for known states of an element.
 
@@ -317,19 +441,19 @@ def lookup_element_shannon_radius_data(symbol, copy=True):
     Args:
         symbol (str) : the atomic symbol of the element to look up.
 
-        copy (Optional(bool)): if True (default), return a copy of the data
-        dictionary, rather than a reference to the cached object --
-        only use copy=False in performance-sensitive code and where
-        you are certain the dictionary will not be modified!
+        mutable (Optional(bool)): if True, return a fresh list of
+        mutable dicts rather than the shared immutable datasets from
+        the cache -- only needed if the caller wants to modify the
+        result.
 
     Returns:
-        list:
-            Shannon radii datasets.
+        tuple:
+            Shannon radii datasets (a list of dicts if mutable=True).
 
         Returns None if the element was not found among the external
         data.
 
-        Shannon radii datasets are dictionaries with the keys:
+        Shannon radii datasets are ShannonData records with the fields:
 
         charge
             *int* charge
@@ -343,56 +467,106 @@ def lookup_element_shannon_radius_data(symbol, copy=True):
             *str*
     """
 
+    datasets = _lookup_element_shannon_radius_data(symbol)
+
+    if datasets is None:
+        _warn("Shannon-radius data for element {0} not found.", symbol)
+        return None
+
+    if mutable:
+        return [dict(item._asdict()) for item in datasets]
+
+    return datasets
+
+
+@lru_cache(maxsize=None)
+def _lookup_element_shannon_radius_data(symbol):
+    """Memoized core of lookup_element_shannon_radius_data()."""
+
     global _element_shannon_radii_data
 
+    if _element_shannon_radii_data is None:
+        cached = _load_data_cache().get('element_shannon_radii_data')
+
+        if cached is not None:
+            _element_shannon_radii_data = {
+                symbol: tuple(ShannonData(**dataset)
+                              for dataset in datasets)
+                for symbol, datasets in cached.items()}
+
     if _element_shannon_radii_data is None:
         _element_shannon_radii_data = {}
 
-        with open(os.path.join(data_directory, "shannon_radii.csv"),
-                  'r') as file:
-            reader = csv.reader(file)
-
-            # Skip the first row (headers).
-
-            next(reader)
-
-            for row in reader:
-                # For the shannon radii, there are multiple datasets for
-                # different element/oxidation-state/coordination
-                # combinations.
-
-                key = row[0]
-
-                dataset = {
-                    'charge': int(row[1]),
-                    'coordination': row[2],
-                    'crystal_radius': float(row[3]),
-                    'ionic_radius': float(row[4]),
-                    'comment': row[5]
-                    }
-
-                if key in _element_shannon_radii_data:
-                    _element_shannon_radii_data[key].append(dataset)
-                else:
-                    _element_shannon_radii_data[key] = [dataset]
-
-    if symbol in _element_shannon_radii_data:
-        if copy:
-            # _element_shannon_radii_data stores a list of dictionaries
-            # -> if copy is set, copy the list and use the dict.copy()
-            # function on each element.
-            # The dictionary values are all Python "value types", so
-            # nothing further is required to make a deep copy.
-            return [item.copy() for item in
-                    _element_shannon_radii_data[symbol]]
-        else:
-            return _element_shannon_radii_data[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Shannon-radius data for element {0} not "
-                  "found.".format(symbol))
+        df = pd.read_csv(os.path.join(data_directory, "shannon_radii.csv"))
 
-        return None
+        # For the shannon radii, there are multiple datasets for
+        # different element/oxidation-state/coordination combinations;
+        # grouping on the element column builds each (frozen)
+        # per-element tuple in one pass, without a membership test per
+        # row.
+
+        for key, group in df.groupby('ion', sort=False):
+            _element_shannon_radii_data[sys.intern(key)] = tuple(
+                ShannonData(
+                    charge=int(row.charge),
+                    coordination=row.coordination,
+                    crystal_radius=float(row.crystal_radius),
+                    ionic_radius=float(row.ionic_radius),
+                    comment=('' if pd.isnull(row.comments)
+                             else row.comments))
+                for row in group.itertuples(index=False))
+
+    # _element_shannon_radii_data stores tuples of immutable records,
+    # so the cached entry is handed out directly.  The field values are
+    # all Python "value types", so nothing further is required to make
+    # a deep copy.
+
+    return _element_shannon_radii_data.get(symbol)
+
+
+# Secondary index over the Shannon-radius data keyed by
+# (symbol, charge, coordination), so queries for one specific
+# oxidation-state/coordination combination are a single dict probe
+# rather than a linear scan over the element's datasets.
+
+_shannon_radii_by_key = None
+
+
+def lookup_shannon_radius(symbol, charge, coordination):
+    """
+    Retrieve the Shannon radius dataset for one specific state.
+
+    This is the targeted counterpart to
+    lookup_element_shannon_radius_data(): instead of returning every
+    dataset for the element and leaving the caller to filter, it
+    resolves a single (symbol, charge, coordination) combination with
+    one dict probe.
+
+    Args:
+        symbol (str) : the atomic symbol of the element to look up.
+        charge (int) : the oxidation state.
+        coordination (str) : the coordination environment, as listed in
+            shannon_radii.csv (e.g. '6_n').
+
+    Returns:
+        ShannonData: the matching dataset, or None if the combination
+            was not found among the external data.
+    """
+
+    global _shannon_radii_by_key
+
+    if _shannon_radii_by_key is None:
+        # Ensure the per-element table is populated; the placeholder
+        # symbol is the same one used by _load_all().
+
+        _lookup_element_shannon_radius_data("X0")
+
+        _shannon_radii_by_key = {
+            (sym, dataset.charge, dataset.coordination): dataset
+            for sym, datasets in _element_shannon_radii_data.items()
+            for dataset in datasets}
+
+    return _shannon_radii_by_key.get((symbol, charge, coordination))
 
 # Loader and cache for the element solid-state energy (SSE) datasets.
 
@@ -428,36 +602,43 @@ def lookup_element_sse_data(symbol):
         SolidStateRenormalisationEnergy
             *float*
     """
+    dataset = _lookup_element_sse_data(symbol)
+
+    if dataset is None:
+        _warn("Solid-state energy data for element {0} not found.",
+              symbol)
+
+    return dataset
+
+
+@lru_cache(maxsize=None)
+def _lookup_element_sse_data(symbol):
+    """Memoized core of lookup_element_sse_data()."""
 
     global _element_ssedata
 
+    if _element_ssedata is None:
+        _element_ssedata = _load_data_cache().get('element_ssedata')
+
     if _element_ssedata is None:
         _element_ssedata = {}
 
-        with open(os.path.join(data_directory,
-                               "SSE.csv"), 'r') as file:
-            reader = csv.reader(file)
-
-            for row in reader:
-                dataset = {
-                    'AtomicNumber': int(row[1]),
-                    'SolidStateEnergy': float(row[2]),
-                    'IonisationPotential': float(row[3]),
-                    'ElectronAffinity': float(row[4]),
-                    'MullikenElectronegativity': float(row[5]),
-                    'SolidStateRenormalisationEnergy': float(row[6])
-                    }
-
-                _element_ssedata[row[0]] = dataset
-
-    if symbol in _element_ssedata:
-        return _element_ssedata[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Solid-state energy data for element {0} not"
-                  " found.".format(symbol))
+        df = pd.read_csv(os.path.join(data_directory, "SSE.csv"),
+                         header=None)
 
-        return None
+        for row in df.itertuples(index=False):
+            dataset = {
+                'AtomicNumber': int(row[1]),
+                'SolidStateEnergy': float(row[2]),
+                'IonisationPotential': float(row[3]),
+                'ElectronAffinity': float(row[4]),
+                'MullikenElectronegativity': float(row[5]),
+                'SolidStateRenormalisationEnergy': float(row[6])
+                }
+
+            _element_ssedata[sys.intern(row[0])] = dataset
+
+    return _element_ssedata.get(symbol)
 
 # Loader and cache for the revised (2015) element solid-state energy
 # (SSE) datasets.
@@ -465,7 +646,7 @@ def lookup_element_sse_data(symbol):
 _element_sse2015_data = None
 
 
-def lookup_element_sse2015_data(symbol, copy=True):
+def lookup_element_sse2015_data(symbol, mutable=False):
     """
     Retrieve SSE (2015) data for element in oxidation state.
 
@@ -475,13 +656,12 @@ def lookup_element_sse2015_data(symbol, copy=True):
 
     Args:
         symbol : the atomic symbol of the element to look up.
-        copy: if True (default), return a copy of the data dictionary,
-        rather than a reference to a cached object -- only use
-        copy=False in performance-sensitive code and where you are
-        certain the dictionary will not be modified!
+        mutable: if True, return a fresh list of mutable dicts rather
+        than the shared immutable datasets from the cache -- only
+        needed if the caller wants to modify the result.
 
     Returns:
-        list : SSE datasets for the element, or None
+        tuple : SSE datasets for the element, or None
             if the element was not found among the external data.
 
         SSE datasets are dictionaries with the keys:
@@ -492,42 +672,49 @@ def lookup_element_sse2015_data(symbol, copy=True):
             *float* SSE2015
     """
 
+    datasets = _lookup_element_sse2015_data(symbol)
+
+    if datasets is None:
+        _warn("Solid-state energy (revised 2015) data for element {0} "
+              "not found.", symbol)
+        return None
+
+    return [dict(item) for item in datasets] if mutable else datasets
+
+
+@lru_cache(maxsize=None)
+def _lookup_element_sse2015_data(symbol):
+    """Memoized core of lookup_element_sse2015_data()."""
+
     global _element_sse2015_data
 
     if _element_sse2015_data is None:
-        _element_sse2015_data = {}
-
-        with open(os.path.join(data_directory, "SSE_2015.csv"),
-                  'r') as file:
-            reader = csv.reader(file)
+        cached = _load_data_cache().get('element_sse2015_data')
 
-            for row in reader:
-                # Elements can have multiple SSE values depending on
-                # their oxidation state
+        if cached is not None:
+            _element_sse2015_data = {
+                symbol: tuple(MappingProxyType(dataset)
+                              for dataset in datasets)
+                for symbol, datasets in cached.items()}
 
-                key = row[0]
+    if _element_sse2015_data is None:
+        _element_sse2015_data = {}
 
-                dataset = {
-                    'OxidationState': int(row[1]),
-                    'SolidStateEnergy2015': float(row[2])}
+        df = pd.read_csv(os.path.join(data_directory, "SSE_2015.csv"),
+                         header=None)
 
-                if key in _element_sse2015_data:
-                    _element_sse2015_data[key].append(dataset)
-                else:
-                    _element_sse2015_data[key] = [dataset]
+        # Elements can have multiple SSE values depending on their
+        # oxidation state; grouping on the element column builds each
+        # (frozen) per-element tuple in one pass.
 
-    if symbol in _element_sse2015_data:
-        if copy:
-            return [item.copy() for item in
-                    _element_sse2015_data[symbol]]
-        else:
-            return _element_sse2015_data[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Solid-state energy (revised 2015) data for "
-                  "element {0} not found.".format(symbol))
+        for key, group in df.groupby(0, sort=False):
+            _element_sse2015_data[sys.intern(key)] = tuple(
+                MappingProxyType({
+                    'OxidationState': int(row[1]),
+                    'SolidStateEnergy2015': float(row[2])})
+                for row in group.itertuples(index=False))
 
-        return None
+    return _element_sse2015_data.get(symbol)
 
 # Loader and cache for the element solid-state energy (SSE) from Pauling
 # electronegativity datasets.
@@ -550,28 +737,170 @@ def lookup_element_sse_pauling_data(symbol):
         element, or None if the element was not found among the external
         data.
     """
+    dataset = _lookup_element_sse_pauling_data(symbol)
+
+    if dataset is None:
+        _warn("Solid-state energy data from Pauling "
+              " electronegativity regression fit for "
+              " element {0} not found.", symbol)
+
+    return dataset
+
+
+@lru_cache(maxsize=None)
+def _lookup_element_sse_pauling_data(symbol):
+    """Memoized core of lookup_element_sse_pauling_data()."""
 
     global _element_ssepauling_data
 
+    if _element_ssepauling_data is None:
+        _element_ssepauling_data = \
+            _load_data_cache().get('element_ssepauling_data')
+
     if _element_ssepauling_data is None:
         _element_ssepauling_data = {}
 
-        with open(os.path.join(data_directory, "SSE_Pauling.csv"),
-                  'r') as file:
-            reader = csv.reader(file)
+        df = pd.read_csv(os.path.join(data_directory, "SSE_Pauling.csv"),
+                         header=None)
 
-            for row in reader:
-                dataset = {
-                    'SolidStateEnergyPauling': float(row[1])}
+        for row in df.itertuples(index=False):
+            dataset = {
+                'SolidStateEnergyPauling': float(row[1])}
 
-                _element_ssepauling_data[row[0]] = dataset
+            _element_ssepauling_data[sys.intern(row[0])] = dataset
 
-    if symbol in _element_ssepauling_data:
-        return _element_ssepauling_data[symbol]
-    else:
-        if _print_warnings:
-            print("WARNING: Solid-state energy data from Pauling "
-                  " electronegativity regression fit for "
-                  " element {0} not found.".format(symbol))
+    return _element_ssepauling_data.get(symbol)
 
-        return None
+
+# Struct-of-arrays table collecting the scalar numeric properties of
+# every element in one contiguous numpy record array, for vectorised
+# bulk queries.  The ragged datasets (oxidation states, Shannon radii,
+# SSE 2015) do not fit a fixed-width record and stay in their own
+# caches above.
+
+_element_soa = None
+_element_soa_index = None
+
+_ELEMENT_SOA_FIELDS = ('Z', 'Mass', 'r_cov', 'e_affinity', 'p_eig',
+                       's_eig', 'Abundance', 'el_neg', 'ion_pot',
+                       'dipol', 'HHI_p', 'HHI_r', 'SSE', 'SSEPauling')
+
+
+def _get_element_soa():
+    """Build (once) and return the struct-of-arrays element table.
+
+    Returns:
+        tuple: (table, index) where table is a numpy record array with
+            one row per element and the fields in _ELEMENT_SOA_FIELDS,
+            and index is a dict mapping element symbols to row numbers.
+            Missing data is stored as NaN.
+    """
+
+    global _element_soa, _element_soa_index
+
+    if _element_soa is None:
+        symbols = list(_element_data.keys())
+
+        table = np.full(len(symbols), np.nan,
+                        dtype=[(field, 'f8')
+                               for field in _ELEMENT_SOA_FIELDS])
+
+        for i, symbol in enumerate(symbols):
+            dataset = _element_data[symbol]
+
+            for field in _ELEMENT_SOA_FIELDS[:10]:
+                value = getattr(dataset, field)
+                if value is not None:
+                    table[field][i] = value
+
+            hhis = _element_hhis.get(symbol)
+            if hhis is not None:
+                table['HHI_p'][i], table['HHI_r'][i] = hhis
+
+            sse_data = _element_ssedata.get(symbol)
+            if sse_data is not None:
+                table['SSE'][i] = sse_data['SolidStateEnergy']
+
+            sse_pauling_data = _element_ssepauling_data.get(symbol)
+            if sse_pauling_data is not None:
+                table['SSEPauling'][i] = \
+                    sse_pauling_data['SolidStateEnergyPauling']
+
+        table.setflags(write=False)
+
+        _element_soa = table
+        _element_soa_index = {symbol: i for i, symbol in enumerate(symbols)}
+
+    return _element_soa, _element_soa_index
+
+
+def lookup_elements_bulk(symbols, field):
+    """
+    Retrieve one numeric property for many elements at once.
+
+    This is a vectorised alternative to constructing Element objects or
+    calling the per-symbol lookup functions in a loop, intended for
+    screening workflows that query the same property for large numbers
+    of compositions.
+
+    Args:
+        symbols (iterable of str) : atomic symbols to look up.
+        field (str) : one of 'Z', 'Mass', 'r_cov', 'e_affinity',
+            'p_eig', 's_eig', 'Abundance', 'el_neg', 'ion_pot',
+            'dipol', 'HHI_p', 'HHI_r', 'SSE' or 'SSEPauling'.
+
+    Returns:
+        numpy.ndarray: Array of float64 property values in the order
+            the symbols were given, with NaN where data is missing.
+
+    Raises:
+        KeyError: a symbol was not found in the element table.
+    """
+
+    table, index = _get_element_soa()
+
+    rows = np.fromiter((index[symbol] for symbol in symbols),
+                       dtype='i4')
+
+    return table[field][rows]
+
+
+def _load_all():
+    """Populate every data cache in one go.
+
+    Calling each lookup function once with a placeholder symbol forces
+    its table to be parsed up front, so that no later call pays the
+    one-off file-parsing cost mid-calculation.  The placeholder is not a
+    real element symbol and the (disabled-by-default) warning system is
+    the only thing that would notice it.
+
+    The loaders are independent and the C-level parsers in pandas and
+    numpy release the GIL, so the files are parsed on a small thread
+    pool and the cold start costs roughly as much as the slowest single
+    file.
+    """
+
+    lookups = (lookup_element_oxidation_states,
+               lookup_element_oxidation_states_icsd,
+               lookup_element_oxidation_states_sp,
+               lookup_element_hhis,
+               lookup_element_data,
+               lookup_element_shannon_radius_data,
+               lookup_element_sse_data,
+               lookup_element_sse2015_data,
+               lookup_element_sse_pauling_data)
+
+    # Read the bundled pickle (if any) on the calling thread first, so
+    # the workers never race to load it.
+
+    _load_data_cache()
+
+    with ThreadPoolExecutor(max_workers=len(lookups)) as executor:
+        list(executor.map(lambda lookup: lookup("X0"), lookups))
+
+    # The struct-of-arrays table joins several of the caches primed
+    # above, so it is built last.
+
+    _get_element_soa()
+
+_load_all()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import unittest
+import numpy as np
 import smact
 from smact.properties import compound_electroneg, band_gap_Harrison
 from smact.builder import wurtzite
@@ -38,7 +39,7 @@ class TestSequenceFunctions(unittest.TestCase):
         newlist = ['O', 'Rb', 'W']
         dictionary = smact.element_dictionary(newlist)
         self.assertEqual(dictionary['O'].crustal_abundance, 461000.0)
-        self.assertEqual(dictionary['Rb'].oxidation_states, [-1, 1])
+        self.assertEqual(dictionary['Rb'].oxidation_states, (-1, 1))
         self.assertEqual(dictionary['W'].name, 'Tungsten')
         self.assertTrue('Rn' in smact.element_dictionary())
 
@@ -72,6 +73,25 @@ class TestSequenceFunctions(unittest.TestCase):
         self.assertEqual(len(neutral_combos), 9)
         self.assertTrue((3, 2, 1) in neutral_combos)
 
+    # ---------------- Data loader ----------------
+
+    def test_lookup_elements_bulk(self):
+        masses = smact.data_loader.lookup_elements_bulk(
+            ['H', 'Fe'], 'Mass')
+        self.assertEqual(list(masses), [1.0078250322, 55.845])
+        hhi_p = smact.data_loader.lookup_elements_bulk(['H'], 'HHI_p')
+        self.assertTrue(np.isnan(hhi_p[0]))
+        with self.assertRaises(KeyError):
+            smact.data_loader.lookup_elements_bulk(['Zz'], 'Mass')
+
+    def test_lookup_shannon_radius(self):
+        dataset = smact.data_loader.lookup_shannon_radius(
+            'Fe', 3, '6_n')
+        self.assertEqual(dataset.crystal_radius, 0.74)
+        self.assertEqual(dataset.ionic_radius, 0.6)
+        self.assertIsNone(smact.data_loader.lookup_shannon_radius(
+            'Fe', 3, 'nonsense'))
+
     # ---------------- Properties ----------------
 
     def test_compound_eneg_brass(self):
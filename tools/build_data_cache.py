@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""
+Build the pre-parsed data cache shipped with SMACT.
+
+This script parses all of the text data files in smact/data via the
+loaders in smact.data_loader and pickles the resulting tables to
+smact/data/smact_data.pkl.  At run time the data loader reads this
+single file instead of tokenising each text file, which makes the
+cold-start import noticeably cheaper.
+
+Run this script (from the repository root) whenever any of the text
+data files is modified, and commit the regenerated pickle alongside:
+
+    python tools/build_data_cache.py
+"""
+
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from smact import data_directory  # noqa: E402
+from smact import data_loader  # noqa: E402
+
+
+def main():
+    # Importing smact.data_loader populates every cache from the text
+    # files (the bundled pickle, if any, is deliberately ignored here
+    # by clearing the cache handle and the module-level tables first).
+
+    data_loader._data_cache = {}
+    data_loader._ox_state_tables.clear()
+
+    for name in ('_element_hhis', '_element_data',
+                 '_element_shannon_radii_data', '_element_ssedata',
+                 '_element_sse2015_data', '_element_ssepauling_data'):
+        setattr(data_loader, name, None)
+
+    for func in (data_loader._lookup_oxidation_states,
+                 data_loader._lookup_element_hhis,
+                 data_loader._lookup_element_data,
+                 data_loader._lookup_element_shannon_radius_data,
+                 data_loader._lookup_element_sse_data,
+                 data_loader._lookup_element_sse2015_data,
+                 data_loader._lookup_element_sse_pauling_data):
+        func.cache_clear()
+
+    data_loader._load_all()
+
+    # The in-memory tables wrap some entries in namedtuple records or
+    # read-only MappingProxyType views; store plain dicts and let the
+    # loaders re-wrap them on load.
+
+    tables = {
+        'el_ox_states': data_loader._ox_state_tables['smact'],
+        'el_ox_states_icsd': data_loader._ox_state_tables['icsd'],
+        'el_ox_states_sp': data_loader._ox_state_tables['sp'],
+        'element_hhis': data_loader._element_hhis,
+        'element_data': {symbol: dict(dataset._asdict())
+                         for symbol, dataset
+                         in data_loader._element_data.items()},
+        'element_shannon_radii_data': {
+            symbol: [dict(dataset._asdict()) for dataset in datasets]
+            for symbol, datasets
+            in data_loader._element_shannon_radii_data.items()},
+        'element_ssedata': data_loader._element_ssedata,
+        'element_sse2015_data': {
+            symbol: [dict(dataset) for dataset in datasets]
+            for symbol, datasets
+            in data_loader._element_sse2015_data.items()},
+        'element_ssepauling_data': data_loader._element_ssepauling_data,
+        }
+
+    cache_file = os.path.join(data_directory,
+                              data_loader._DATA_CACHE_FILENAME)
+
+    with open(cache_file, 'wb') as file:
+        pickle.dump(tables, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    print("Wrote {0}".format(cache_file))
+
+
+if __name__ == "__main__":
+    main()